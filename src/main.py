@@ -1,8 +1,22 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from src.portfolio.providers.price.buda.client import (
+    close_async_http_clients,
+    open_async_http_client,
+)
 from src.rest.router import router as portfolio_router
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    open_async_http_client()
+    yield
+    await close_async_http_clients()
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 @app.get("/health")
@@ -1,18 +1,134 @@
+from functools import lru_cache
+from http import HTTPStatus
+
+import httpx
+import requests
+from pydantic import TypeAdapter
+
 from src.portfolio.providers.price.buda.models import (
     BudaMarketsResponse,
     BudaMarketTickerResponse,
 )
-from src.shared.http_client import create_client
+from src.shared.async_http_client import AsyncHTTPClient, create_async_client
+from src.shared.http_client import HTTPClient, create_client
+
+
+BUDA_API_URL = "https://www.buda.com/api/v2"
+BUDA_POOL_SIZE = 50
+
+# Built once at import time so every response reuses the compiled validators
+_MARKETS_ADAPTER = TypeAdapter(BudaMarketsResponse)
+_MARKET_TICKER_ADAPTER = TypeAdapter(BudaMarketTickerResponse)
+
+
+@lru_cache(maxsize=None)
+def _get_http_client(base_url: str) -> HTTPClient:
+    # One session per base URL keeps its connection pool (and TLS sessions) alive
+    # across requests. The session is only used for plain GETs without mutating
+    # its state, which is safe to share between FastAPI's worker threads.
+    return create_client(
+        base_url=base_url,
+        pool_connections=BUDA_POOL_SIZE,
+        pool_maxsize=BUDA_POOL_SIZE,
+    )
+
+
+# The async clients (and the in-flight calls cached around them) are tied to the
+# event loop that uses them, so they are created and closed by the app lifespan
+# rather than lazily on whichever loop happens to make the first request
+_async_http_clients: dict[str, AsyncHTTPClient] = {}
+
+
+def open_async_http_client(base_url: str = BUDA_API_URL) -> None:
+    """Create the shared async client for ``base_url`` if it is not open yet."""
+    if base_url not in _async_http_clients:
+        _async_http_clients[base_url] = create_async_client(
+            base_url=base_url,
+            http2=True,
+            max_keepalive_connections=BUDA_POOL_SIZE,
+        )
+
+
+def _get_async_http_client(base_url: str) -> AsyncHTTPClient:
+    # Only ever called from the event loop thread, so no lock is needed
+    try:
+        return _async_http_clients[base_url]
+    except KeyError:
+        raise RuntimeError(
+            f"No async HTTP client is open for {base_url}; "
+            "run the app under its lifespan"
+        ) from None
+
+
+async def close_async_http_clients() -> None:
+    """Close the shared async clients opened by open_async_http_client."""
+    clients = list(_async_http_clients.values())
+    _async_http_clients.clear()
+    for client in clients:
+        await client.close()
 
 
 class BudaClient:
-    def __init__(self):
-        self.http_client = create_client(base_url="https://www.buda.com/api/v2")
+    def __init__(self, base_url: str = BUDA_API_URL):
+        self.base_url = base_url
+        self.http_client = _get_http_client(base_url)
+        # Last /markets response with its ETag/Last-Modified validators, used to
+        # revalidate with a conditional GET instead of downloading it again
+        self._markets_cache: tuple[BudaMarketsResponse, dict[str, str]] | None = None
+
+    @property
+    def async_http_client(self) -> AsyncHTTPClient:
+        # Looked up on each use so a client closed at shutdown is never reused
+        return _get_async_http_client(self.base_url)
+
+    def _markets_request_headers(self) -> dict[str, str]:
+        if self._markets_cache is None:
+            return {}
+        _, validators = self._markets_cache
+        headers = {}
+        if "ETag" in validators:
+            headers["If-None-Match"] = validators["ETag"]
+        if "Last-Modified" in validators:
+            headers["If-Modified-Since"] = validators["Last-Modified"]
+        return headers
+
+    def _parse_markets_response(
+        self, response: requests.Response | httpx.Response
+    ) -> BudaMarketsResponse:
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            # Only sent back for a conditional GET, which needs a cached list
+            if self._markets_cache is None:
+                raise RuntimeError("Buda answered 304 for /markets with nothing cached")
+            return self._markets_cache[0]
+        markets = _MARKETS_ADAPTER.validate_json(response.content)
+        validators = {
+            header: response.headers[header]
+            for header in ("ETag", "Last-Modified")
+            if header in response.headers
+        }
+        self._markets_cache = (markets, validators)
+        return markets
 
     def get_markets(self) -> BudaMarketsResponse:
-        response = self.http_client.get("/markets")
-        return BudaMarketsResponse.model_validate(response.json())
+        response = self.http_client.get(
+            "/markets",
+            headers=self._markets_request_headers(),
+            allow_not_modified=True,
+        )
+        return self._parse_markets_response(response)
 
     def get_market_price(self, market: str) -> BudaMarketTickerResponse:
-        response = self.http_client.get(f"/markets/{market}/ticker")
-        return BudaMarketTickerResponse.model_validate(response.json())
+        raw = self.http_client.get_bytes(f"/markets/{market}/ticker")
+        return _MARKET_TICKER_ADAPTER.validate_json(raw)
+
+    async def aget_markets(self) -> BudaMarketsResponse:
+        response = await self.async_http_client.get(
+            "/markets",
+            headers=self._markets_request_headers(),
+            allow_not_modified=True,
+        )
+        return self._parse_markets_response(response)
+
+    async def aget_market_price(self, market: str) -> BudaMarketTickerResponse:
+        raw = await self.async_http_client.get_bytes(f"/markets/{market}/ticker")
+        return _MARKET_TICKER_ADAPTER.validate_json(raw)
@@ -1,37 +1,30 @@
-from pydantic import BaseModel
+from decimal import Decimal
 
+from pydantic import BaseModel, ConfigDict
 
+
+# Only the fields read by the provider are declared; Buda returns many more per
+# market and ticker, which are skipped without being validated.
 class _BudaMarketResponse(BaseModel):
-    base_currency: str
-    quote_currency: str
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     id: str
-    name: str | None = None
-    minimum_order_amount: list | None = None
-    disabled: bool | None = None
-    illiquid: bool | None = None
-    rpo_disabled: bool | None = None
-    taker_fee: float | None = None
-    maker_fee: float | None = None
-    max_orders_per_minute: int | None = None
-    maker_discount_percentage: str | None = None
-    taker_discount_percentage: str | None = None
-    taker_discount_tiers: dict | None = None
-    maker_discount_tiers: dict | None = None
 
 
 class BudaMarketsResponse(BaseModel):
-    markets: list[_BudaMarketResponse]
+    model_config = ConfigDict(frozen=True)
+
+    markets: tuple[_BudaMarketResponse, ...]
 
 
 class _BudaMarketTickerResponse(BaseModel):
-    market_id: str
-    last_price: list
-    min_ask: list
-    max_bid: list
-    volume: list
-    price_variation_24h: float
-    price_variation_7d: float
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    # [amount, currency], e.g. ["67000000.0", "CLP"]
+    last_price: tuple[Decimal, str]
 
 
 class BudaMarketTickerResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     ticker: _BudaMarketTickerResponse
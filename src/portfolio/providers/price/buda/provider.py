@@ -1,14 +1,38 @@
 from decimal import Decimal
 from src.portfolio.providers.price.buda.client import BudaClient
 from src.portfolio.providers.price.interface import PriceProviderInterface
+from src.shared.cache import ttl_cache
+
+
+# Buda's market list changes rarely, so it is shared across requests
+VALID_MARKETS_TTL = 300
+# Prices are kept just long enough to collapse bursts of identical ticker calls
+MARKET_PRICE_TTL = 2
+MARKET_PRICE_CACHE_SIZE = 256
+
+
+@ttl_cache(ttl=VALID_MARKETS_TTL, key=lambda client: client.base_url)
+async def _get_valid_markets_cached(client: BudaClient) -> frozenset[str]:
+    response = await client.aget_markets()
+    return frozenset(market.id.lower() for market in response.markets)
+
+
+@ttl_cache(
+    ttl=MARKET_PRICE_TTL,
+    maxsize=MARKET_PRICE_CACHE_SIZE,
+    key=lambda client, market: (client.base_url, market),
+)
+async def _get_market_price_cached(client: BudaClient, market: str) -> Decimal:
+    response = await client.aget_market_price(market)
+    return response.ticker.last_price[0]
 
 
 class BudaPriceProvider(PriceProviderInterface):
     def __init__(self):
         self.client = BudaClient()
 
-    def get_valid_markets(self) -> list[str]:
-        return [market.id.lower() for market in self.client.get_markets().markets]
+    async def get_valid_markets(self) -> frozenset[str]:
+        return await _get_valid_markets_cached(self.client)
 
-    def get_market_price(self, market: str) -> Decimal:
-        return Decimal(self.client.get_market_price(market).ticker.last_price[0])
+    async def get_market_price(self, market: str) -> Decimal:
+        return await _get_market_price_cached(self.client, market)
@@ -1,7 +1,8 @@
+from collections.abc import Set
 from decimal import Decimal
 
 
 class PriceProviderInterface:
-    def get_valid_markets(self) -> list[str]: ...
+    async def get_valid_markets(self) -> Set[str]: ...
 
-    def get_market_price(self, market: str) -> Decimal: ...
+    async def get_market_price(self, market: str) -> Decimal: ...
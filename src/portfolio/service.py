@@ -1,3 +1,5 @@
+import asyncio
+from collections.abc import Set
 from decimal import Decimal
 
 from fastapi import HTTPException
@@ -9,25 +11,58 @@ class PortfolioService:
     def __init__(self, price_provider: PriceProviderInterface):
         self.price_provider = price_provider
 
-    def _build_market_id(self, asset: str, target_currency: str) -> str:
-        return f"{asset}-{target_currency}".lower()
+    def _build_market_id(self, asset: str, quote_currency: str) -> str:
+        # quote_currency is expected lowercased once by the caller, since it is
+        # shared by every asset in the portfolio
+        return f"{asset.lower()}-{quote_currency}"
 
-    def validate_portfolio_assets(
+    def _build_market_ids(
         self, portfolio: PortfolioType, target_currency: str
-    ) -> None:
-        valid_markets = self.price_provider.get_valid_markets()
-        for asset, _ in portfolio.items():
-            market = self._build_market_id(asset, target_currency)
+    ) -> dict[str, str]:
+        quote_currency = target_currency.lower()
+        return {
+            asset: self._build_market_id(asset, quote_currency) for asset in portfolio
+        }
+
+    def _check_markets(self, markets: dict[str, str], valid_markets: Set[str]) -> None:
+        for asset, market in markets.items():
             if market not in valid_markets:
                 raise HTTPException(status_code=400, detail=f"Invalid asset: {asset}")
+
+    async def validate_portfolio_assets(
+        self, portfolio: PortfolioType, target_currency: str
+    ) -> None:
+        valid_markets = await self.price_provider.get_valid_markets()
+        self._check_markets(
+            self._build_market_ids(portfolio, target_currency), valid_markets
+        )
         return None
 
-    def get_portfolio_value(
+    async def get_portfolio_value(
         self, portfolio: PortfolioType, target_currency: str
     ) -> Decimal:
-        value = Decimal(0)
-        for asset, amount in portfolio.items():
-            market = self._build_market_id(asset, target_currency)
-            price = self.price_provider.get_market_price(market)
-            value += price * amount
-        return value
+        markets = self._build_market_ids(portfolio, target_currency)
+        prices = await asyncio.gather(
+            *(
+                self.price_provider.get_market_price(market)
+                for market in markets.values()
+            )
+        )
+        return self._sum_value(prices, portfolio)
+
+    async def compute(self, portfolio: PortfolioType, target_currency: str) -> Decimal:
+        """
+        Validate the portfolio and compute its value.
+
+        Every market is checked against the valid markets before any price is
+        requested, so only markets the provider lists are ever fetched; the
+        prices of those markets are then requested concurrently.
+        """
+        await self.validate_portfolio_assets(portfolio, target_currency)
+        return await self.get_portfolio_value(portfolio, target_currency)
+
+    def _sum_value(self, prices: list[Decimal], portfolio: PortfolioType) -> Decimal:
+        return sum(
+            (price * amount for price, amount in zip(prices, portfolio.values())),
+            Decimal(0),
+        )
@@ -0,0 +1,28 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from src.portfolio.providers.price.buda.provider import BudaPriceProvider
+from src.portfolio.providers.price.interface import PriceProviderInterface
+from src.portfolio.service import PortfolioService
+
+
+# The provider and service hold no per-request state, so a single instance of
+# each (and with it a single BudaClient) is shared by the whole process
+_price_provider = BudaPriceProvider()
+_portfolio_service = PortfolioService(price_provider=_price_provider)
+
+
+# Declared async so FastAPI resolves them on the event loop instead of
+# dispatching each one to its threadpool on every request
+async def get_price_provider() -> PriceProviderInterface:
+    return _price_provider
+
+
+async def get_portfolio_service(
+    price_provider: Annotated[PriceProviderInterface, Depends(get_price_provider)],
+) -> PortfolioService:
+    # Reuse the shared service unless get_price_provider has been overridden
+    if price_provider is _price_provider:
+        return _portfolio_service
+    return PortfolioService(price_provider=price_provider)
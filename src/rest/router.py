@@ -1,7 +1,9 @@
-from fastapi import APIRouter
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
 
-from src.portfolio.providers.price.buda.provider import BudaPriceProvider
 from src.portfolio.service import PortfolioService
+from src.rest.dependencies import get_portfolio_service
 from src.rest.schemas.request.portfolio import PortfolioValueRequest
 from src.rest.schemas.responses.portfolio import PortfolioValueResponse
 
@@ -10,13 +12,12 @@ router = APIRouter()
 
 
 @router.post("/portfolio/value")
-def portfolio_value(request: PortfolioValueRequest) -> PortfolioValueResponse:
-    service = PortfolioService(price_provider=BudaPriceProvider())
-    service.validate_portfolio_assets(
-        portfolio=request.portfolio, target_currency=request.fiat_currency
-    )
+async def portfolio_value(
+    request: PortfolioValueRequest,
+    service: Annotated[PortfolioService, Depends(get_portfolio_service)],
+) -> PortfolioValueResponse:
     return PortfolioValueResponse(
-        value=service.get_portfolio_value(
+        value=await service.compute(
             portfolio=request.portfolio, target_currency=request.fiat_currency
         )
     )
@@ -0,0 +1,252 @@
+"""
+Async HTTP Client implementation using the httpx library.
+
+This module provides the asyncio counterpart of ``src.shared.http_client`` so
+I/O-bound callers can issue several requests concurrently from the event loop.
+
+Shared behaviour (headers, logging, retry policy, JSON decoding) lives in
+``src.shared.base_http_client``.
+"""
+
+import asyncio
+import logging
+from http import HTTPStatus
+
+import httpx
+from urllib3.exceptions import MaxRetryError
+
+from src.shared.base_http_client import (
+    DEFAULT_STATUS_FORCELIST,
+    BaseHTTPClient,
+    make_retry,
+)
+
+
+class AsyncHTTPClient(BaseHTTPClient):
+    """
+    An asyncio HTTP client implementation using the httpx library.
+
+    This client covers the verbs the async callers need (GET and POST) and
+    includes features like:
+    - Automatic retries with exponential backoff, using the same retry policy
+      as HTTPClient
+    - Request/response logging
+    - Error handling and validation
+    - A persistent httpx.AsyncClient for connection pooling
+    - Optional HTTP/2 multiplexing
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        timeout: int = 30,
+        max_retries: int = 3,
+        backoff_factor: float = 0.3,
+        status_forcelist: tuple = DEFAULT_STATUS_FORCELIST,
+        headers: dict | None = None,
+        verify_ssl: bool = True,
+        logger: logging.Logger | None = None,
+        http2: bool = False,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+    ):
+        """
+        Initialize the async HTTP client.
+
+        Args:
+            base_url: Base URL for all requests (optional)
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retries for failed requests
+            backoff_factor: Backoff factor for retry delays
+            status_forcelist: HTTP status codes that should trigger a retry
+            headers: Default headers to include with all requests
+            verify_ssl: Whether to verify SSL certificates
+            logger: Custom logger instance (optional)
+            http2: Whether to negotiate HTTP/2, multiplexing requests on one socket
+            max_connections: Maximum number of concurrent connections
+            max_keepalive_connections: Maximum number of idle connections kept alive
+        """
+        super().__init__(base_url=base_url, timeout=timeout, logger=logger)
+
+        self.retry = make_retry(max_retries, backoff_factor, status_forcelist)
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            headers={**(headers or {}), **self._default_headers},
+            # The transport retries failed connections; retries on statuses in
+            # status_forcelist are handled in _make_request
+            transport=httpx.AsyncHTTPTransport(
+                retries=max_retries,
+                verify=verify_ssl,
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                ),
+            ),
+        )
+
+    async def _make_request(
+        self,
+        method: str,
+        url: str,
+        raise_for_status: bool = True,
+        allow_not_modified: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Make an HTTP request with the given method.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: URL to make the request to
+            raise_for_status: Whether to raise an exception for HTTP error status codes
+            allow_not_modified: Whether a 304 Not Modified answering a conditional
+                request is returned instead of raised
+            **kwargs: Additional arguments to pass to httpx
+
+        Returns:
+            httpx.Response: The response object
+
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        full_url = self._build_url(url)
+        self._log_request(method, full_url, **kwargs)
+
+        try:
+            retry = self.retry
+            while True:
+                response = await self.client.request(method, full_url, **kwargs)
+                self._log_response(response)
+                if not retry.is_retry(method, response.status_code):
+                    break
+                try:
+                    retry = retry.increment(method, full_url)
+                except MaxRetryError:
+                    break
+                await asyncio.sleep(retry.get_backoff_time())
+
+            not_modified = response.status_code == HTTPStatus.NOT_MODIFIED
+            if raise_for_status and not (allow_not_modified and not_modified):
+                response.raise_for_status()
+
+            return response
+
+        except httpx.HTTPError as e:
+            self.logger.error("Request failed: %s", e)
+            raise
+
+    async def get(
+        self,
+        url: str,
+        params: dict | None = None,
+        headers: dict | None = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Make a GET request.
+
+        Args:
+            url: URL to make the request to
+            params: Query parameters
+            headers: Additional headers
+            **kwargs: Additional arguments to pass to httpx
+
+        Returns:
+            httpx.Response: The response object
+        """
+        return await self._make_request(
+            "GET", url, params=params, headers=headers, **kwargs
+        )
+
+    async def get_bytes(
+        self,
+        url: str,
+        params: dict | None = None,
+        headers: dict | None = None,
+        **kwargs,
+    ) -> bytes:
+        """
+        Make a GET request and return the raw response body.
+
+        Useful to hand the bytes straight to ``model_validate_json`` without
+        decoding them to text or building intermediate dicts.
+
+        Args:
+            url: URL to make the request to
+            params: Query parameters
+            headers: Additional headers
+            **kwargs: Additional arguments to pass to httpx
+
+        Returns:
+            bytes: The response body
+        """
+        response = await self.get(url, params=params, headers=headers, **kwargs)
+        return response.content
+
+    async def post(
+        self,
+        url: str,
+        data: dict | None = None,
+        json: dict | None = None,
+        headers: dict | None = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Make a POST request.
+
+        Args:
+            url: URL to make the request to
+            data: Request body data
+            json: JSON data to send
+            headers: Additional headers
+            **kwargs: Additional arguments to pass to httpx
+
+        Returns:
+            httpx.Response: The response object
+        """
+        return await self._make_request(
+            "POST", url, data=data, json=json, headers=headers, **kwargs
+        )
+
+    async def close(self) -> None:
+        """Close the underlying client and free up resources."""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+
+# Convenience function to create an async client instance
+def create_async_client(
+    base_url: str | None = None,
+    timeout: int = 30,
+    max_retries: int = 3,
+    headers: dict | None = None,
+    **kwargs,
+) -> AsyncHTTPClient:
+    """
+    Create a new AsyncHTTPClient instance with the given configuration.
+
+    Args:
+        base_url: Base URL for all requests
+        timeout: Request timeout in seconds
+        max_retries: Maximum number of retries
+        headers: Default headers
+        **kwargs: Additional configuration options
+
+    Returns:
+        AsyncHTTPClient: A configured async HTTP client instance
+    """
+    return AsyncHTTPClient(
+        base_url=base_url,
+        timeout=timeout,
+        max_retries=max_retries,
+        headers=headers,
+        **kwargs,
+    )
@@ -0,0 +1,133 @@
+"""
+Shared building blocks for the sync and async HTTP clients.
+
+This module holds what ``src.shared.http_client`` (requests) and
+``src.shared.async_http_client`` (httpx) have in common: default headers, URL
+building, the retry policy, logging and JSON decoding.
+
+JSON bodies are decoded with orjson (see ``BaseHTTPClient.json``); when the
+payload is validated into a pydantic model, prefer passing the raw
+``response.content`` bytes to ``model_validate_json``/``TypeAdapter.validate_json``
+instead.
+"""
+
+import logging
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
+
+import orjson
+from urllib3.util.retry import Retry
+
+
+DEFAULT_STATUS_FORCELIST = (500, 502, 504)
+
+
+def make_retry(
+    max_retries: int, backoff_factor: float, status_forcelist: Iterable[int]
+) -> Retry:
+    """Build the retry policy once per configuration and share it."""
+    # Normalised to a tuple so lists are accepted as cache keys too
+    return _make_retry(max_retries, backoff_factor, tuple(status_forcelist))
+
+
+@lru_cache(maxsize=None)
+def _make_retry(
+    max_retries: int, backoff_factor: float, status_forcelist: tuple[int, ...]
+) -> Retry:
+    return Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=status_forcelist,
+        allowed_methods=[
+            "HEAD",
+            "GET",
+            "PUT",
+            "DELETE",
+            "OPTIONS",
+            "TRACE",
+            "POST",
+            "PATCH",
+        ],
+    )
+
+
+class BaseHTTPClient:
+    """
+    Common behaviour of the HTTP clients.
+
+    Subclasses provide the transport and the verb methods; this class provides:
+    - Default JSON headers
+    - URL building against an optional base URL
+    - Request/response logging
+    - JSON decoding with orjson
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        timeout: int = 30,
+        logger: logging.Logger | None = None,
+    ):
+        """
+        Initialize the shared client state.
+
+        Args:
+            base_url: Base URL for all requests (optional)
+            timeout: Request timeout in seconds
+            logger: Custom logger instance (optional)
+        """
+        self._default_headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+
+        self.base_url = base_url
+        self.timeout = timeout
+        self.logger = logger or logging.getLogger(type(self).__module__)
+
+    def _build_url(self, url: str) -> str:
+        """Build the full URL by joining with base_url if provided."""
+        if self.base_url:
+            return f"{self.base_url}/{url.lstrip('/')}"
+        return url
+
+    @staticmethod
+    def json(response: Any) -> Any:
+        """
+        Decode the JSON body of a response with orjson.
+
+        Args:
+            response: The response object (requests or httpx)
+
+        Returns:
+            Any: The decoded JSON document
+        """
+        return orjson.loads(response.content)
+
+    def _log_request(self, method: str, url: str, **kwargs) -> None:
+        """Log the outgoing request."""
+        self.logger.info("Making %s request to %s", method.upper(), url)
+        # Skip the lookups entirely under production log levels
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        if kwargs.get("params"):
+            self.logger.debug("Query params: %s", kwargs["params"])
+        if kwargs.get("json"):
+            self.logger.debug("Request body (JSON): %s", kwargs["json"])
+        if kwargs.get("data"):
+            self.logger.debug("Request body (data): %s", kwargs["data"])
+
+    def _log_response(self, response: Any) -> None:
+        """Log the response details."""
+        # requests names the reason phrase ``reason``, httpx ``reason_phrase``
+        reason = getattr(response, "reason", None) or getattr(
+            response, "reason_phrase", ""
+        )
+        self.logger.info("Response: %s %s", response.status_code, reason)
+        # Decoding the body is wasted work unless it is actually logged
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        self.logger.debug("Response headers: %s", response.headers)
+        if response.text:
+            self.logger.debug("Response body: %s...", response.text[:500])
@@ -0,0 +1,100 @@
+"""
+Small in-process caching helpers.
+
+This module provides a time-based cache decorator for coroutines whose values
+are expensive to fetch (remote calls) but change rarely.
+"""
+
+import asyncio
+import functools
+import inspect
+import time
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+def ttl_cache(
+    ttl: float,
+    maxsize: int | None = None,
+    key: Callable[..., Hashable] | None = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Cache the results of a coroutine function for ``ttl`` seconds.
+
+    Concurrent callers with the same key share a single in-flight call instead
+    of each issuing their own. The call keeps running even if its callers are
+    cancelled, and it is evicted if it fails or is cancelled, so failures are
+    never cached.
+
+    The cache is only touched from the event loop thread, so no lock is needed.
+
+    Args:
+        ttl: Number of seconds a cached result stays valid
+        maxsize: Maximum number of entries kept, evicting the oldest first
+            (unbounded if None)
+        key: Function receiving the call arguments and returning the cache key
+            (defaults to the positional and keyword arguments themselves)
+
+    Returns:
+        A decorator wrapping the function with the cache. The wrapped function
+        exposes ``cache_clear()`` to drop every cached entry.
+    """
+
+    def make_key(*args, **kwargs) -> Hashable:
+        if key is not None:
+            return key(*args, **kwargs)
+        return (args, tuple(sorted(kwargs.items())))
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        entries: dict[Hashable, tuple[float, Any]] = {}
+
+        def get(cache_key: Hashable) -> tuple[float, Any] | None:
+            entry = entries.get(cache_key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry
+            return None
+
+        def put(cache_key: Hashable, value: Any) -> tuple[float, Any]:
+            entries.pop(cache_key, None)
+            if maxsize is not None and len(entries) >= maxsize:
+                del entries[next(iter(entries))]
+            entry = entries[cache_key] = (time.monotonic() + ttl, value)
+            return entry
+
+        def on_done(
+            cache_key: Hashable, entry: tuple[float, Any], task: asyncio.Future
+        ) -> None:
+            # Runs on the shared task itself, so failures are evicted (and their
+            # exception retrieved) even when every caller was cancelled
+            failed = task.cancelled() or task.exception() is not None
+            if entries.get(cache_key) is not entry:
+                return
+            if failed:
+                del entries[cache_key]
+            else:
+                # The ttl counts from when the result is available, not from
+                # when a possibly slow call was started
+                entries[cache_key] = (time.monotonic() + ttl, task)
+
+        if not inspect.iscoroutinefunction(func):
+            raise TypeError("ttl_cache only supports coroutine functions")
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            cache_key = make_key(*args, **kwargs)
+            entry = get(cache_key)
+            if entry is None:
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                entry = put(cache_key, task)
+                task.add_done_callback(functools.partial(on_done, cache_key, entry))
+            # Shield the shared task so one cancelled caller does not cancel it
+            # for everyone else waiting on it
+            return await asyncio.shield(entry[1])
+
+        def cache_clear() -> None:
+            entries.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
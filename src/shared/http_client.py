@@ -3,16 +3,25 @@ HTTP Client implementation using the requests library.
 
 This module provides a comprehensive HTTP client that implements all common HTTP verbs
 with proper error handling, logging, and response validation.
+
+Shared behaviour (headers, logging, retry policy, JSON decoding) lives in
+``src.shared.base_http_client``.
 """
 
 import logging
+from http import HTTPStatus
 
 import requests
 from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+
+from src.shared.base_http_client import (
+    DEFAULT_STATUS_FORCELIST,
+    BaseHTTPClient,
+    make_retry,
+)
 
 
-class HTTPClient:
+class HTTPClient(BaseHTTPClient):
     """
     A comprehensive HTTP client implementation using the requests library.
 
@@ -30,10 +39,12 @@ class HTTPClient:
         timeout: int = 30,
         max_retries: int = 3,
         backoff_factor: float = 0.3,
-        status_forcelist: tuple = (500, 502, 504),
-        headers: dict = {},
+        status_forcelist: tuple = DEFAULT_STATUS_FORCELIST,
+        headers: dict | None = None,
         verify_ssl: bool = True,
         logger: logging.Logger | None = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
     ):
         """
         Initialize the HTTP client.
@@ -47,71 +58,36 @@ class HTTPClient:
             headers: Default headers to include with all requests
             verify_ssl: Whether to verify SSL certificates
             logger: Custom logger instance (optional)
+            pool_connections: Number of host connection pools to cache
+            pool_maxsize: Maximum number of connections kept alive per host
         """
-        self._default_headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
-
-        self.base_url = base_url
-        self.timeout = timeout
-        self.logger = logger or logging.getLogger(__name__)
+        super().__init__(base_url=base_url, timeout=timeout, logger=logger)
 
         # Create session for connection pooling
         self.session = requests.Session()
 
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=backoff_factor,
-            status_forcelist=status_forcelist,
-            allowed_methods=[
-                "HEAD",
-                "GET",
-                "PUT",
-                "DELETE",
-                "OPTIONS",
-                "TRACE",
-                "POST",
-                "PATCH",
-            ],
+        # Only the retry policy is shared: each session owns its adapter, since
+        # closing the session also clears the adapter's connection pool
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=make_retry(max_retries, backoff_factor, status_forcelist),
         )
-
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
-        headers.update(self._default_headers)
-        self.session.headers.update(headers)
+        self.session.headers.update({**(headers or {}), **self._default_headers})
 
         # Set SSL verification
         self.session.verify = verify_ssl
 
-    def _build_url(self, url: str) -> str:
-        """Build the full URL by joining with base_url if provided."""
-        if self.base_url:
-            return f"{self.base_url}/{url.lstrip('/')}"
-        return url
-
-    def _log_request(self, method: str, url: str, **kwargs) -> None:
-        """Log the outgoing request."""
-        self.logger.info(f"Making {method.upper()} request to {url}")
-        if kwargs.get("params"):
-            self.logger.debug(f"Query params: {kwargs['params']}")
-        if kwargs.get("json"):
-            self.logger.debug(f"Request body (JSON): {kwargs['json']}")
-        if kwargs.get("data"):
-            self.logger.debug(f"Request body (data): {kwargs['data']}")
-
-    def _log_response(self, response: requests.Response) -> None:
-        """Log the response details."""
-        self.logger.info(f"Response: {response.status_code} {response.reason}")
-        self.logger.debug(f"Response headers: {dict(response.headers)}")
-        if response.text:
-            self.logger.debug(f"Response body: {response.text[:500]}...")
-
     def _make_request(
-        self, method: str, url: str, raise_for_status: bool = True, **kwargs
+        self,
+        method: str,
+        url: str,
+        raise_for_status: bool = True,
+        allow_not_modified: bool = False,
+        **kwargs,
     ) -> requests.Response:
         """
         Make an HTTP request with the given method.
@@ -120,6 +96,8 @@ class HTTPClient:
             method: HTTP method (GET, POST, etc.)
             url: URL to make the request to
             raise_for_status: Whether to raise an exception for HTTP error status codes
+            allow_not_modified: Whether a 304 Not Modified answering a conditional
+                request is returned instead of raised
             **kwargs: Additional arguments to pass to requests
 
         Returns:
@@ -140,20 +118,21 @@ class HTTPClient:
             response = self.session.request(method, full_url, **kwargs)
             self._log_response(response)
 
-            if raise_for_status:
+            not_modified = response.status_code == HTTPStatus.NOT_MODIFIED
+            if raise_for_status and not (allow_not_modified and not_modified):
                 response.raise_for_status()
 
             return response
 
         except requests.RequestException as e:
-            self.logger.error(f"Request failed: {e}")
+            self.logger.error("Request failed: %s", e)
             raise
 
     def get(
         self,
         url: str,
         params: dict | None = None,
-        headers: dict = {},
+        headers: dict | None = None,
         **kwargs,
     ) -> requests.Response:
         """
@@ -170,12 +149,37 @@ class HTTPClient:
         """
         return self._make_request("GET", url, params=params, headers=headers, **kwargs)
 
+    def get_bytes(
+        self,
+        url: str,
+        params: dict | None = None,
+        headers: dict | None = None,
+        **kwargs,
+    ) -> bytes:
+        """
+        Make a GET request and return the raw response body.
+
+        Useful to hand the bytes straight to ``model_validate_json`` without
+        decoding them to text or building intermediate dicts.
+
+        Args:
+            url: URL to make the request to
+            params: Query parameters
+            headers: Additional headers
+            **kwargs: Additional arguments to pass to requests
+
+        Returns:
+            bytes: The response body
+        """
+        response = self.get(url, params=params, headers=headers, **kwargs)
+        return response.content
+
     def post(
         self,
         url: str,
         data: dict | str | bytes | None = None,
         json: dict | None = None,
-        headers: dict = {},
+        headers: dict | None = None,
         **kwargs,
     ) -> requests.Response:
         """
@@ -200,7 +204,7 @@ class HTTPClient:
         url: str,
         data: dict | str | bytes | None = None,
         json: dict | None = None,
-        headers: dict = {},
+        headers: dict | None = None,
         **kwargs,
     ) -> requests.Response:
         """
@@ -225,7 +229,7 @@ class HTTPClient:
         url: str,
         data: dict | str | bytes | None = None,
         json: dict | None = None,
-        headers: dict = {},
+        headers: dict | None = None,
         **kwargs,
     ) -> requests.Response:
         """
@@ -245,7 +249,9 @@ class HTTPClient:
             "PATCH", url, data=data, json=json, headers=headers, **kwargs
         )
 
-    def delete(self, url: str, headers: dict = {}, **kwargs) -> requests.Response:
+    def delete(
+        self, url: str, headers: dict | None = None, **kwargs
+    ) -> requests.Response:
         """
         Make a DELETE request.
 
@@ -259,7 +265,9 @@ class HTTPClient:
         """
         return self._make_request("DELETE", url, headers=headers, **kwargs)
 
-    def head(self, url: str, headers: dict = {}, **kwargs) -> requests.Response:
+    def head(
+        self, url: str, headers: dict | None = None, **kwargs
+    ) -> requests.Response:
         """
         Make a HEAD request.
 
@@ -273,7 +281,9 @@ class HTTPClient:
         """
         return self._make_request("HEAD", url, headers=headers, **kwargs)
 
-    def options(self, url: str, headers: dict = {}, **kwargs) -> requests.Response:
+    def options(
+        self, url: str, headers: dict | None = None, **kwargs
+    ) -> requests.Response:
         """
         Make an OPTIONS request.
 
@@ -305,7 +315,7 @@ def create_client(
     base_url: str | None = None,
     timeout: int = 30,
     max_retries: int = 3,
-    headers: dict = {},
+    headers: dict | None = None,
     **kwargs,
 ) -> HTTPClient:
     """
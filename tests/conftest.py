@@ -0,0 +1,29 @@
+import pytest
+from src.portfolio.providers.price.buda.provider import (
+    BudaPriceProvider,
+    _get_market_price_cached,
+    _get_valid_markets_cached,
+)
+from src.portfolio.service import PortfolioService
+from src.rest import dependencies
+
+
+def _clear_price_caches() -> None:
+    _get_valid_markets_cached.cache_clear()
+    _get_market_price_cached.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_module_state(monkeypatch: pytest.MonkeyPatch):
+    # Cached tasks and the singletons' BudaClient (with its cached /markets
+    # response) would otherwise leak from one test into the next
+    _clear_price_caches()
+    price_provider = BudaPriceProvider()
+    monkeypatch.setattr(dependencies, "_price_provider", price_provider)
+    monkeypatch.setattr(
+        dependencies,
+        "_portfolio_service",
+        PortfolioService(price_provider=price_provider),
+    )
+    yield
+    _clear_price_caches()
@@ -1,19 +1,42 @@
+from decimal import Decimal
+
+import httpx
+import pytest
 from fastapi.testclient import TestClient
 from src.main import app
 from pytest_mock import MockerFixture
-from src.portfolio.providers.price.buda.provider import BudaPriceProvider
+from src.portfolio.providers.price.buda.client import BudaClient
+from src.portfolio.providers.price.buda.models import (
+    BudaMarketsResponse,
+    BudaMarketTickerResponse,
+)
+from src.portfolio.providers.price.buda.provider import (
+    BudaPriceProvider,
+    _get_valid_markets_cached,
+)
+from src.portfolio.providers.price.interface import PriceProviderInterface
+from src.rest import dependencies
+from src.rest.dependencies import get_price_provider
+from src.shared.async_http_client import AsyncHTTPClient
 
 
-client = TestClient(app)
+@pytest.fixture
+def client():
+    # Run under the lifespan so every request shares one event loop and the
+    # async HTTP client it opens
+    with TestClient(app) as client:
+        yield client
 
 
-def test_health_endpoint():
+def test_health_endpoint(client: TestClient):
     resp = client.get("/health")
     assert resp.status_code == 200
     assert resp.json() == {"status": "healthy"}
 
 
-def test_portfolio_value_endpoint_invalid_assert(mocker: MockerFixture):
+def test_portfolio_value_endpoint_invalid_assert(
+    client: TestClient, mocker: MockerFixture
+):
     mocker.patch.object(
         BudaPriceProvider,
         "get_valid_markets",
@@ -27,7 +50,9 @@ def test_portfolio_value_endpoint_invalid_assert(mocker: MockerFixture):
     assert resp.status_code == 400
 
 
-def test_portfolio_value_endpoint_valid_assert(mocker: MockerFixture):
+def test_portfolio_value_endpoint_valid_assert(
+    client: TestClient, mocker: MockerFixture
+):
     mocker.patch.object(
         BudaPriceProvider,
         "get_valid_markets",
@@ -40,7 +65,9 @@ def test_portfolio_value_endpoint_valid_assert(mocker: MockerFixture):
     assert resp.json() == {"value": "60"}
 
 
-def test_portfolio_value_endpoint_different_prices(mocker: MockerFixture):
+def test_portfolio_value_endpoint_different_prices(
+    client: TestClient, mocker: MockerFixture
+):
     mocker.patch.object(
         BudaPriceProvider,
         "get_valid_markets",
@@ -58,7 +85,9 @@ def test_portfolio_value_endpoint_different_prices(mocker: MockerFixture):
     assert resp.json() == {"value": "56003"}
 
 
-def test_portfolio_value_endpoint_invalid_fiat_currency(mocker: MockerFixture):
+def test_portfolio_value_endpoint_invalid_fiat_currency(
+    client: TestClient, mocker: MockerFixture
+):
     mocker.patch.object(
         BudaPriceProvider,
         "get_valid_markets",
@@ -67,3 +96,134 @@ def test_portfolio_value_endpoint_invalid_fiat_currency(mocker: MockerFixture):
     data = {"portfolio": {"BTC": 1, "ETH": 2, "USDT": 3}, "fiat_currency": "INVALID"}
     resp = client.post("/portfolio/value", json=data)
     assert resp.status_code == 400
+
+
+def test_portfolio_value_endpoint_caches_valid_markets(
+    client: TestClient, mocker: MockerFixture
+):
+    aget_markets = mocker.patch.object(
+        BudaClient,
+        "aget_markets",
+        return_value=BudaMarketsResponse.model_validate(
+            {
+                "markets": [
+                    {"id": "BTC-CLP", "base_currency": "BTC", "quote_currency": "CLP"},
+                    {"id": "ETH-CLP", "base_currency": "ETH", "quote_currency": "CLP"},
+                ]
+            }
+        ),
+    )
+    mocker.patch.object(BudaPriceProvider, "get_market_price", return_value=10)
+    data = {"portfolio": {"BTC": 1, "ETH": 2}, "fiat_currency": "CLP"}
+    for _ in range(2):
+        resp = client.post("/portfolio/value", json=data)
+        assert resp.status_code == 200
+        assert resp.json() == {"value": "30"}
+    aget_markets.assert_called_once()
+
+
+def test_portfolio_value_endpoint_caches_market_prices(
+    client: TestClient, mocker: MockerFixture
+):
+    mocker.patch.object(
+        BudaPriceProvider,
+        "get_valid_markets",
+        return_value=["btc-clp", "eth-clp", "usdt-clp"],
+    )
+    aget_market_price = mocker.patch.object(
+        BudaClient,
+        "aget_market_price",
+        return_value=BudaMarketTickerResponse.model_validate(
+            {
+                "ticker": {
+                    "market_id": "BTC-CLP",
+                    "last_price": ["10.0", "CLP"],
+                    "min_ask": ["10.0", "CLP"],
+                    "max_bid": ["10.0", "CLP"],
+                    "volume": ["1.0", "BTC"],
+                    "price_variation_24h": 0.0,
+                    "price_variation_7d": 0.0,
+                }
+            }
+        ),
+    )
+    data = {"portfolio": {"BTC": 1}, "fiat_currency": "CLP"}
+    for _ in range(2):
+        resp = client.post("/portfolio/value", json=data)
+        assert resp.status_code == 200
+        assert resp.json() == {"value": "10.0"}
+    aget_market_price.assert_called_once_with("btc-clp")
+
+
+def test_portfolio_value_endpoint_invalid_asset_fetches_no_prices(
+    client: TestClient, mocker: MockerFixture
+):
+    mocker.patch.object(
+        BudaPriceProvider,
+        "get_valid_markets",
+        return_value=["btc-clp", "eth-clp", "usdt-clp"],
+    )
+    aget_market_price = mocker.patch.object(BudaClient, "aget_market_price")
+    data = {"portfolio": {"BTC": 1, "../../users/me?x=": 2}, "fiat_currency": "CLP"}
+    resp = client.post("/portfolio/value", json=data)
+    assert resp.status_code == 400
+    assert resp.json() == {"detail": "Invalid asset: ../../users/me?x="}
+    aget_market_price.assert_not_called()
+
+
+def test_portfolio_value_endpoint_revalidates_markets_with_etag(
+    client: TestClient, mocker: MockerFixture
+):
+    request = httpx.Request("GET", "https://www.buda.com/api/v2/markets")
+    get = mocker.patch.object(
+        AsyncHTTPClient,
+        "get",
+        side_effect=[
+            httpx.Response(
+                200,
+                json={"markets": [{"id": "BTC-CLP"}]},
+                headers={"ETag": '"markets-v1"'},
+                request=request,
+            ),
+            httpx.Response(304, request=request),
+        ],
+    )
+    mocker.patch.object(BudaPriceProvider, "get_market_price", return_value=10)
+    data = {"portfolio": {"BTC": 1}, "fiat_currency": "CLP"}
+    for _ in range(2):
+        resp = client.post("/portfolio/value", json=data)
+        assert resp.status_code == 200
+        assert resp.json() == {"value": "10"}
+        _get_valid_markets_cached.cache_clear()
+    assert get.call_args_list[0].kwargs["headers"] == {}
+    assert get.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"markets-v1"'}
+
+
+class _FixedPriceProvider(PriceProviderInterface):
+    async def get_valid_markets(self) -> frozenset[str]:
+        return frozenset({"btc-clp"})
+
+    async def get_market_price(self, market: str) -> Decimal:
+        return Decimal(7)
+
+
+def test_portfolio_value_endpoint_uses_overridden_price_provider(client: TestClient):
+    app.dependency_overrides[get_price_provider] = _FixedPriceProvider
+    try:
+        resp = client.post(
+            "/portfolio/value",
+            json={"portfolio": {"BTC": 2}, "fiat_currency": "CLP"},
+        )
+    finally:
+        app.dependency_overrides.clear()
+    assert resp.status_code == 200
+    assert resp.json() == {"value": "14"}
+
+
+def test_shutdown_closes_async_http_client():
+    with TestClient(app) as lifespan_client:
+        assert lifespan_client.get("/health").status_code == 200
+        http_client = dependencies._price_provider.client.async_http_client
+    assert http_client.client.is_closed
+    with pytest.raises(RuntimeError):
+        dependencies._price_provider.client.async_http_client
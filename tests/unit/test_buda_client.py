@@ -0,0 +1,98 @@
+import asyncio
+
+import httpx
+import pytest
+import requests
+from pytest_mock import MockerFixture
+from src.portfolio.providers.price.buda.client import (
+    BudaClient,
+    close_async_http_clients,
+    open_async_http_client,
+)
+
+
+MARKETS_BODY = b'{"markets": [{"id": "BTC-CLP"}]}'
+
+
+@pytest.fixture(autouse=True)
+def async_http_client():
+    open_async_http_client()
+    yield
+    asyncio.run(close_async_http_clients())
+
+
+def _sync_response(status_code: int, content: bytes = b"", headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers.update(headers or {})
+    return response
+
+
+def _async_response(status_code: int, content: bytes = b"", headers=None):
+    return httpx.Response(
+        status_code,
+        content=content,
+        headers=headers,
+        request=httpx.Request("GET", "https://www.buda.com/api/v2/markets"),
+    )
+
+
+def test_get_markets_revalidates_with_etag(mocker: MockerFixture):
+    request = mocker.patch.object(
+        requests.Session,
+        "request",
+        side_effect=[
+            _sync_response(200, MARKETS_BODY, {"ETag": '"markets-v1"'}),
+            _sync_response(304),
+        ],
+    )
+    client = BudaClient()
+
+    first = client.get_markets()
+    second = client.get_markets()
+
+    assert second is first
+    assert [market.id for market in second.markets] == ["BTC-CLP"]
+    assert request.call_args_list[0].kwargs["headers"] == {}
+    assert request.call_args_list[1].kwargs["headers"] == {
+        "If-None-Match": '"markets-v1"'
+    }
+
+
+def test_aget_markets_revalidates_with_last_modified(mocker: MockerFixture):
+    last_modified = "Wed, 14 Oct 2026 12:00:00 GMT"
+    request = mocker.patch.object(
+        httpx.AsyncClient,
+        "request",
+        side_effect=[
+            _async_response(200, MARKETS_BODY, {"Last-Modified": last_modified}),
+            _async_response(304),
+        ],
+    )
+    client = BudaClient()
+
+    first = asyncio.run(client.aget_markets())
+    second = asyncio.run(client.aget_markets())
+
+    assert second is first
+    assert request.call_args_list[1].kwargs["headers"] == {
+        "If-Modified-Since": last_modified
+    }
+
+
+def test_aget_markets_rejects_not_modified_without_cache(mocker: MockerFixture):
+    mocker.patch.object(httpx.AsyncClient, "request", return_value=_async_response(304))
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(BudaClient().aget_markets())
+
+
+def test_aget_markets_logs_and_raises_http_errors(mocker: MockerFixture):
+    mocker.patch.object(httpx.AsyncClient, "request", return_value=_async_response(404))
+    client = BudaClient()
+    error = mocker.patch.object(client.async_http_client.logger, "error")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.aget_markets())
+    error.assert_called_once()
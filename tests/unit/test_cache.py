@@ -0,0 +1,87 @@
+import asyncio
+import gc
+
+import pytest
+from src.shared.cache import ttl_cache
+
+
+def test_ttl_cache_evicts_failure_when_every_caller_was_cancelled():
+    calls = 0
+    release = asyncio.Event()
+
+    @ttl_cache(ttl=60)
+    async def fetch() -> str:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        if calls == 1:
+            raise RuntimeError("upstream failed")
+        return "fresh"
+
+    async def scenario() -> list:
+        unhandled = []
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: unhandled.append(context)
+        )
+
+        waiter = asyncio.ensure_future(fetch())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        # The shared call keeps running and fails with nobody waiting on it
+        release.set()
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        assert await fetch() == "fresh"
+        gc.collect()
+        return unhandled
+
+    assert asyncio.run(scenario()) == []
+    assert calls == 2
+
+
+def test_ttl_cache_shares_in_flight_call():
+    calls = 0
+
+    @ttl_cache(ttl=60)
+    async def fetch(market: str) -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return market
+
+    async def scenario() -> list[str]:
+        return await asyncio.gather(fetch("btc-clp"), fetch("btc-clp"))
+
+    assert asyncio.run(scenario()) == ["btc-clp", "btc-clp"]
+    assert calls == 1
+
+
+def test_ttl_cache_rejects_sync_functions():
+    with pytest.raises(TypeError):
+
+        @ttl_cache(ttl=60)
+        def fetch() -> str:
+            return "value"
+
+
+def test_ttl_cache_starts_ttl_when_the_call_completes():
+    calls = 0
+
+    @ttl_cache(ttl=0.05)
+    async def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        # Slower than the ttl itself
+        await asyncio.sleep(0.1)
+        return calls
+
+    async def scenario() -> list[int]:
+        first = await fetch()
+        return [first, await fetch()]
+
+    assert asyncio.run(scenario()) == [1, 1]
+    assert calls == 1
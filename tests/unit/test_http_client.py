@@ -0,0 +1,89 @@
+import asyncio
+
+import httpx
+import pytest
+import requests
+from pytest_mock import MockerFixture
+from src.shared.async_http_client import AsyncHTTPClient
+from src.shared.http_client import HTTPClient
+
+
+def _response(status_code: int, **kwargs) -> httpx.Response:
+    return httpx.Response(
+        status_code, request=httpx.Request("GET", "https://example.com/x"), **kwargs
+    )
+
+
+def test_async_client_retries_statuses_in_forcelist(mocker: MockerFixture):
+    request = mocker.patch.object(
+        httpx.AsyncClient,
+        "request",
+        side_effect=[_response(502), _response(504), _response(200, json={})],
+    )
+    sleep = mocker.patch("src.shared.async_http_client.asyncio.sleep")
+    client = AsyncHTTPClient(base_url="https://example.com", backoff_factor=0.5)
+
+    response = asyncio.run(client.get("/x"))
+
+    assert response.status_code == 200
+    assert request.call_count == 3
+    assert request.call_args.args == ("GET", "https://example.com/x")
+    # Same backoff as urllib3: no delay before the first retry, then exponential
+    assert [call.args[0] for call in sleep.call_args_list] == [0, 1.0]
+
+
+def test_async_client_raises_after_exhausting_retries(mocker: MockerFixture):
+    request = mocker.patch.object(
+        httpx.AsyncClient, "request", side_effect=[_response(502)] * 3
+    )
+    mocker.patch("src.shared.async_http_client.asyncio.sleep")
+    client = AsyncHTTPClient(max_retries=2)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.get("https://example.com/x"))
+    assert request.call_count == 3
+
+
+def test_json_decodes_response_content():
+    sync_response = requests.Response()
+    sync_response._content = b'{"markets": [{"id": "BTC-CLP"}]}'
+    async_response = _response(200, content=b'{"markets": [{"id": "BTC-CLP"}]}')
+
+    assert HTTPClient.json(sync_response) == {"markets": [{"id": "BTC-CLP"}]}
+    assert AsyncHTTPClient.json(async_response) == {"markets": [{"id": "BTC-CLP"}]}
+
+
+def test_log_response_includes_reason_of_either_client(mocker: MockerFixture):
+    sync_response = requests.Response()
+    sync_response.status_code = 404
+    sync_response.reason = "Not Found"
+    sync_client = HTTPClient()
+    async_client = AsyncHTTPClient()
+    sync_info = mocker.patch.object(sync_client.logger, "info")
+    async_info = mocker.patch.object(async_client.logger, "info")
+
+    sync_client._log_response(sync_response)
+    async_client._log_response(_response(404))
+
+    sync_info.assert_called_once_with("Response: %s %s", 404, "Not Found")
+    async_info.assert_called_once_with("Response: %s %s", 404, "Not Found")
+
+
+def test_closing_a_client_keeps_other_clients_pools():
+    shared = HTTPClient(base_url="https://example.com")
+    with HTTPClient(base_url="https://example.com") as short_lived:
+        pass
+
+    shared_adapter = shared.session.get_adapter("https://example.com")
+    closed_adapter = short_lived.session.get_adapter("https://example.com")
+    assert shared_adapter is not closed_adapter
+    assert shared_adapter.max_retries is closed_adapter.max_retries
+
+
+def test_clients_accept_status_forcelist_as_list():
+    sync_client = HTTPClient(status_forcelist=[500, 503])
+    async_client = AsyncHTTPClient(status_forcelist=[500, 503])
+
+    retry = sync_client.session.get_adapter("https://example.com").max_retries
+    assert retry is async_client.retry
+    assert retry.status_forcelist == (500, 503)